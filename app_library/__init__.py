@@ -1,6 +1,12 @@
 """Application discovery utilities."""
-from .base import App
-from .loader import create_app, get_app_entry, launch_app, list_apps, load_global_manifest
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover - imported for static analysis only
+    from .base import App
+    from .loader import create_app, get_app_entry, launch_app, list_apps, load_global_manifest
 
 __all__ = [
     "App",
@@ -10,3 +16,27 @@ __all__ = [
     "list_apps",
     "load_global_manifest",
 ]
+
+# Public names resolved on first access (PEP 562) so ``import app_library`` stays cheap.
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "App": (".base", "App"),
+    "create_app": (".loader", "create_app"),
+    "get_app_entry": (".loader", "get_app_entry"),
+    "launch_app": (".loader", "launch_app"),
+    "list_apps": (".loader", "list_apps"),
+    "load_global_manifest": (".loader", "load_global_manifest"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from threading import RLock
 
 
 class App(ABC):
@@ -12,26 +11,30 @@ class App(ABC):
     manage any resources they allocate. The base implementation keeps track of
     whether the application is currently running and provides context-manager
     helpers so apps can be used with ``with`` statements.
+
+    The running flag is a plain boolean: reads and writes of a single
+    attribute are atomic under CPython's GIL, so no lock is taken. Subclasses
+    that need to coordinate across threads should use a
+    :class:`threading.Event` instead.
     """
 
+    # ``__weakref__`` keeps plugins weak-referenceable despite the slots.
+    __slots__ = ("_running", "__weakref__")
+
     def __init__(self) -> None:
         self._running = False
-        self._state_lock = RLock()
 
     @property
     def running(self) -> bool:
         """Return ``True`` while the application is running."""
 
-        with self._state_lock:
-            return self._running
+        return self._running
 
     def _mark_running(self) -> None:
-        with self._state_lock:
-            self._running = True
+        self._running = True
 
     def _mark_stopped(self) -> None:
-        with self._state_lock:
-            self._running = False
+        self._running = False
 
     @abstractmethod
     def start(self) -> None:
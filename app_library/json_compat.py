@@ -0,0 +1,28 @@
+"""JSON decoding shared by the manifest loaders.
+
+:mod:`orjson` is used when it is installed, but it is stricter than the
+standard library (for example it rejects ``NaN`` and ``Infinity``). Documents
+it refuses are re-parsed with :mod:`json`, so whether a manifest loads never
+depends on which parser happens to be available.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Decode the JSON document in *data* with :func:`json.loads` semantics."""
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
@@ -1,61 +1,123 @@
 """Helpers for discovering and launching applications."""
 from __future__ import annotations
 
-import json
+import os
+import sys
 from collections.abc import Mapping
+from functools import lru_cache
 from importlib import import_module
 from os import PathLike
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Union
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple, Union
 
 from .base import App
+from .json_compat import loads as _json_loads
 
 _BASE_DIR = Path(__file__).resolve().parent.parent
-_GLOBAL_MANIFEST_PATH = _BASE_DIR / "apps" / "manifest.json"
+# Kept as a plain string so lookups can hand it straight to ``open``/``os.stat``.
+_GLOBAL_MANIFEST_PATH = os.fspath(_BASE_DIR / "apps" / "manifest.json")
 
 
-ManifestLike = Union[Mapping[str, Any], str, PathLike[str]]
+PathLikeStr = Union[str, PathLike[str]]
+ManifestLike = Union[Mapping[str, Any], PathLikeStr]
 
 
-def load_global_manifest(path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load the global manifest as a dictionary."""
+class _ManifestIndex(NamedTuple):
+    """Parsed manifest together with its application lookup tables."""
 
-    manifest_path = Path(path) if path else _GLOBAL_MANIFEST_PATH
-    with manifest_path.open("r", encoding="utf-8") as fh:
-        return json.load(fh)
+    data: Mapping[str, Any]
+    apps: Tuple[Dict[str, Any], ...]
+    by_id: Dict[str, Dict[str, Any]]
 
 
-def _manifest_data(manifest: Optional[ManifestLike]) -> Mapping[str, Any]:
-    """Return manifest contents as a mapping regardless of input type."""
+# Indexed manifests keyed by path, invalidated when the file's stat signature changes.
+_MANIFEST_CACHE: Dict[str, Tuple[Tuple[int, int, int], _ManifestIndex]] = {}
+
+
+def _build_index(data: Mapping[str, Any]) -> _ManifestIndex:
+    """Index the ``apps`` entries of *data* by their ``id`` field."""
+
+    apps = tuple(data.get("apps", ()))
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for entry in apps:
+        if "id" in entry:
+            app_id = entry["id"]
+            if isinstance(app_id, str):
+                app_id = sys.intern(app_id)
+            # Keep the first entry for duplicate ids, matching a linear scan.
+            by_id.setdefault(app_id, entry)
+    return _ManifestIndex(data, apps, by_id)
+
+
+def _load_index(path: Optional[PathLikeStr] = None) -> _ManifestIndex:
+    """Return the cached index for the manifest at *path*, reloading if stale."""
+
+    manifest_path = os.fspath(path) if path else _GLOBAL_MANIFEST_PATH
+    st = os.stat(manifest_path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _MANIFEST_CACHE.get(manifest_path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    # Both parsers decode UTF-8 bytes themselves, skipping the text-mode wrapper.
+    with open(manifest_path, "rb") as fh:
+        index = _build_index(_json_loads(fh.read()))
+    _MANIFEST_CACHE[manifest_path] = (signature, index)
+    return index
+
+
+def load_global_manifest(path: Optional[PathLikeStr] = None) -> Dict[str, Any]:
+    """Load the global manifest as a dictionary.
+
+    Parsed manifests are cached in-process and only re-read when the file's
+    modification time, size or inode changes. The returned mapping is shared
+    between callers and must not be mutated.
+    """
+
+    return _load_index(path).data
+
+
+def _manifest_index(manifest: Optional[ManifestLike]) -> _ManifestIndex:
+    """Return the manifest index regardless of input type."""
 
     if manifest is None:
-        return load_global_manifest()
+        return _load_index()
     if isinstance(manifest, Mapping):
-        return manifest
-    return load_global_manifest(Path(manifest))
+        return _build_index(manifest)
+    return _load_index(manifest)
 
 
-def list_apps(manifest: Optional[ManifestLike] = None) -> Iterable[Dict[str, Any]]:
-    """Return the list of registered applications."""
+def list_apps(manifest: Optional[ManifestLike] = None) -> Sequence[Dict[str, Any]]:
+    """Return the registered applications as an immutable sequence."""
 
-    data = _manifest_data(manifest)
-    return data.get("apps", [])
+    return _manifest_index(manifest).apps
 
 
 def get_app_entry(app_id: str, manifest: Optional[ManifestLike] = None) -> Dict[str, Any]:
     """Return the manifest entry for *app_id* or raise :class:`KeyError`."""
 
-    for entry in list_apps(manifest):
-        if entry.get("id") == app_id:
-            return entry
-    raise KeyError(f"No app with id '{app_id}' found in manifest.")
+    try:
+        return _manifest_index(manifest).by_id[app_id]
+    except KeyError:
+        raise KeyError(f"No app with id '{app_id}' found in manifest.") from None
 
 
+@lru_cache(maxsize=None)
 def load_app_class(entry_point: str):
-    """Load the application class referenced by the ``module:Class`` entry point."""
-
-    module_name, class_name = entry_point.split(":", 1)
-    module = import_module(module_name)
+    """Load the application class referenced by the ``module:Class`` entry point.
+
+    Results are memoized per entry point; call ``load_app_class.cache_clear()``
+    after reloading an application module.
+    """
+
+    module_name, sep, class_name = entry_point.partition(":")
+    if not sep:
+        raise ValueError(f"Bad entry_point {entry_point!r}: expected 'module:Class'")
+    module = sys.modules.get(module_name)
+    # A module still executing its body is only partially populated; let the
+    # import system finish (or wait for) it rather than reading it early.
+    if module is None or getattr(module.__spec__, "_initializing", False) is True:
+        module = import_module(module_name)
     return getattr(module, class_name)
 
 
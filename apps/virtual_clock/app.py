@@ -2,24 +2,34 @@
 from __future__ import annotations
 
 import threading
-from datetime import datetime
+import time as _time
 from typing import Callable, Optional
 
-import tkinter as tk
-
 from app_library import App
 
 
 class VirtualClockApp(App):
     """Simple application that renders the current time in a Tkinter window."""
 
+    __slots__ = (
+        "_tk",
+        "_thread_factory",
+        "_ui_thread",
+        "_stop_event",
+        "_root",
+        "_label",
+        "_update_job",
+    )
+
     def __init__(
         self,
         tk_module: Optional[object] = None,
         thread_factory: Optional[Callable[[Callable[[], None]], threading.Thread]] = None,
     ) -> None:
         super().__init__()
-        self._tk = tk_module or tk
+        # ``tkinter`` is imported lazily by the UI thread so that merely loading
+        # this module (e.g. during app discovery) does not pull in Tcl/Tk.
+        self._tk = tk_module
         self._thread_factory = thread_factory or self._default_thread_factory
         self._ui_thread: Optional[threading.Thread] = None
         self._stop_event: Optional[threading.Event] = None
@@ -62,6 +72,14 @@ class VirtualClockApp(App):
         if self._stop_event is not None:
             self._stop_event.set()
 
+        root = self._root
+        if root is not None:
+            # Wake the Tk loop immediately instead of waiting for the next tick.
+            try:
+                root.after(0, root.quit)
+            except Exception:
+                pass
+
         thread = self._ui_thread
         if thread is not None and hasattr(thread, "join"):
             thread.join(timeout=5.0)
@@ -74,29 +92,34 @@ class VirtualClockApp(App):
     # Internal helpers
     # ------------------------------------------------------------------
     def _run_ui_loop(self) -> None:
+        if self._tk is None:
+            import tkinter
+
+            self._tk = tkinter
         root = self._tk.Tk()
         self._root = root
         root.title("Virtual Clock")
 
-        label = self._tk.Label(root, text=self._formatted_time(), font=("Helvetica", 36))
+        displayed = self._formatted_time()
+        label = self._tk.Label(root, text=displayed, font=("Helvetica", 36))
         label.pack(padx=24, pady=24)
         self._label = label
 
-        def update_time() -> None:
-            if self._stop_event and self._stop_event.is_set():
-                return
-            label.config(text=self._formatted_time())
-            self._update_job = root.after(1000, update_time)
-
-        def poll_stop() -> None:
+        def tick() -> None:
+            # Wake once per second, aligned to the wall clock. ``stop()`` schedules
+            # the quit itself; the event check covers a stop that raced startup.
+            nonlocal displayed
             if self._stop_event and self._stop_event.is_set():
                 root.quit()
-            else:
-                root.after(100, poll_stop)
+                return
+            current = self._formatted_time()
+            if current != displayed:
+                displayed = current
+                label.config(text=current)
+            self._update_job = root.after(self._ms_until_next_second(), tick)
 
         root.protocol("WM_DELETE_WINDOW", self._handle_close_request)
-        update_time()
-        root.after(100, poll_stop)
+        self._update_job = root.after(self._ms_until_next_second(), tick)
 
         try:
             root.mainloop()
@@ -111,6 +134,8 @@ class VirtualClockApp(App):
     def _handle_close_request(self) -> None:
         if self._stop_event is not None:
             self._stop_event.set()
+        if self._root is not None:
+            self._root.quit()
 
     def _finalize_from_ui_thread(self) -> None:
         if self._root is not None:
@@ -125,6 +150,10 @@ class VirtualClockApp(App):
         self._stop_event = None
         self._mark_stopped()
 
+    @staticmethod
+    def _ms_until_next_second() -> int:
+        return 1000 - int(_time.time() * 1000) % 1000
+
     @staticmethod
     def _formatted_time() -> str:
-        return datetime.now().strftime("%H:%M:%S")
+        return _time.strftime("%H:%M:%S", _time.localtime())
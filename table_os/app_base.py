@@ -6,9 +6,12 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AppMetadata:
-    """Metadata describing an application that can run on Table OS."""
+    """Metadata describing an application that can run on Table OS.
+
+    Instances are immutable because parsers cache and share them.
+    """
 
     name: str
     module: str
@@ -2,71 +2,320 @@
 
 from __future__ import annotations
 
-import importlib
+import hashlib
 import json
+import os
+import sys
+import tempfile
+from importlib import import_module as _import_module
+from sys import modules as _sys_modules
 from pathlib import Path
 from collections.abc import Iterable
-from typing import Dict, Iterator, List, Tuple
+from typing import Dict, Iterator, List, Set, Tuple, Type
+
+from app_library.json_compat import loads as _json_loads
 
 from .app_base import App, AppMetadata
 
 
+# Validated application classes keyed by ``(module, class_name)``.
+_CLASS_CACHE: Dict[Tuple[str, str], Type[App]] = {}
+
+
+def _cached_import(module_name: str, class_name: str) -> type:
+    """Return *class_name* from *module_name*, reusing an already loaded module."""
+
+    module = _sys_modules.get(module_name)
+    if module is None or getattr(module.__spec__, "_initializing", False) is True:
+        module = _import_module(module_name)
+    try:
+        return getattr(module, class_name)
+    except AttributeError as exc:
+        raise AttributeError(
+            f"Module {module_name!r} does not define {class_name!r}"
+        ) from exc
+
+
+_UNSET = object()
+_YAML_MODULE: object = _UNSET
+
+
 def _optional_yaml_module():
-    import importlib.util
+    """Return the PyYAML module, or ``None`` if it is not installed.
+
+    The lookup happens once per process and is shared by every parser.
+    """
+
+    global _YAML_MODULE
+    if _YAML_MODULE is _UNSET:
+        try:
+            import yaml
+        except ImportError:
+            _YAML_MODULE = None
+        else:
+            _YAML_MODULE = yaml
+    return _YAML_MODULE
+
+
+# Manifest keys mapped onto AppMetadata fields; everything else lands in ``extra``.
+_RESERVED_MANIFEST_KEYS = frozenset(
+    {"name", "module", "class", "class_name", "description", "icon", "entry_point"}
+)
+
+
+def _require_string(value: object, field: str) -> str:
+    """Return *value* stripped and interned, rejecting non-strings and blank strings.
+
+    Interning folds the module, class and name strings repeated across
+    manifests into single objects that also hash and compare cheaply as keys.
+    """
+
+    if not isinstance(value, str):
+        raise ValueError(f"Manifest field {field!r} must be a string.")
+    trimmed = value.strip()
+    if not trimmed:
+        raise ValueError(f"Manifest field {field!r} cannot be empty.")
+    return sys.intern(trimmed)
+
 
-    spec = importlib.util.find_spec("yaml")
-    if spec is None:
-        return None
-    module = importlib.import_module("yaml")
-    return module
+class _StatCache:
+    """Least-recently-used cache of per-file values tagged with the file's stat.
+
+    An entry is only returned while the file's ``st_mtime_ns`` and ``st_size``
+    still match the values recorded when it was stored.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: Dict[Path, Tuple[int, int, object]] = {}
+
+    def get(self, path: Path, st: os.stat_result) -> object:
+        """Return the value cached for *path*, or ``_UNSET`` if missing or stale."""
+
+        entry = self._entries.pop(path, None)
+        if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+            return _UNSET
+        # Re-inserting moves the entry to the most recently used end.
+        self._entries[path] = entry
+        return entry[2]
+
+    def put(self, path: Path, st: os.stat_result, value: object) -> None:
+        """Store *value* for *path*, evicting the least recently used entry."""
+
+        entries = self._entries
+        entries.pop(path, None)
+        if len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+        entries[path] = (st.st_mtime_ns, st.st_size, value)
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class ManifestParser:
     """Parse application manifests that describe Table OS applications."""
 
+    # Lowercase manifest suffixes; YAML suffixes are parsed as YAML, the rest as JSON.
     SUPPORTED_EXTENSIONS = {".json", ".yaml", ".yml"}
+    _YAML_SUFFIXES = (".yaml", ".yml")
+    # JSON copies of parsed YAML manifests, written next to the source file.
+    YAML_CACHE_SUFFIX = ".cache.json"
+    METADATA_CACHE_SIZE = 512
 
     def __init__(self) -> None:
         self._yaml = _optional_yaml_module()
+        self._manifest_cache = _StatCache(self.METADATA_CACHE_SIZE)
+        self._meta_cache = _StatCache(self.METADATA_CACHE_SIZE)
 
     def discover(self, *locations: str | Path) -> Iterator[Path]:
-        """Yield manifest file paths from the provided locations."""
+        """Yield manifest file paths from the provided locations.
 
+        Locations are resolved first and no manifest is yielded twice. A
+        location is skipped only when an earlier walk already covered it, so a
+        location nested below an unreadable directory is still searched.
+        """
+
+        roots: List[Tuple[str, Path]] = []
+        seen = set()
         for location in locations:
             path = Path(location).expanduser().resolve()
+            key = os.fspath(path)
+            if key not in seen:
+                seen.add(key)
+                roots.append((key, path))
+        # Tuple form for ``str.endswith``; derived per call so subclasses can
+        # override SUPPORTED_EXTENSIONS.
+        suffixes = tuple(self.SUPPORTED_EXTENSIONS)
+        visited: Set[str] = set()
+        yielded: Set[str] = set()
+
+        for key, path in roots:
             if path.is_file():
-                if path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
+                name = path.name.lower()
+                if (
+                    key not in yielded
+                    and name.endswith(suffixes)
+                    and not self._is_yaml_cache(name)
+                ):
+                    yielded.add(key)
                     yield path
                 continue
-            if path.is_dir():
-                for candidate in path.rglob("*"):
-                    if (
-                        candidate.is_file()
-                        and candidate.suffix.lower() in self.SUPPORTED_EXTENSIONS
-                    ):
-                        yield candidate
+            if path.is_dir() and key not in visited:
+                for candidate in self._walk(key, suffixes, visited):
+                    if candidate not in yielded:
+                        yielded.add(candidate)
+                        yield Path(candidate)
+
+    def _walk(
+        self, directory: str, suffixes: Tuple[str, ...], visited: Set[str]
+    ) -> Iterator[str]:
+        """Yield paths below *directory* whose names end with one of *suffixes*.
+
+        Directories are walked with an explicit stack rather than recursion.
+        ``DirEntry`` type checks reuse the information returned by the
+        directory read, so irrelevant entries cost neither a ``stat`` call nor
+        a :class:`~pathlib.Path` allocation. Directories already in *visited*
+        are skipped, and each directory is added once it has been read.
+        """
+
+        is_yaml_cache = self._is_yaml_cache
+        mark_visited = visited.add
+        stack = [directory]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            current = pop()
+            if current in visited:
+                continue
+            try:
+                entries = os.scandir(current)
+            except PermissionError:
+                continue
+            mark_visited(current)
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        push(entry.path)
+                    elif entry.is_file():
+                        name = entry.name
+                        # Most manifests are lowercase already; only fold case on a miss.
+                        if (
+                            name.endswith(suffixes) or name.lower().endswith(suffixes)
+                        ) and not is_yaml_cache(name):
+                            yield entry.path
+
+    def _is_yaml_cache(self, name: str) -> bool:
+        """Return ``True`` for JSON sidecars written next to YAML manifests."""
+
+        lowered = name.lower()
+        suffix = self.YAML_CACHE_SUFFIX
+        return lowered.endswith(suffix) and lowered[: -len(suffix)].endswith(self._YAML_SUFFIXES)
 
     def load_manifest(self, manifest_path: Path) -> Dict[str, object]:
-        """Load raw manifest data from *manifest_path*."""
+        """Load raw manifest data from *manifest_path*.
+
+        Parsed data is cached per path while the file's modification time and
+        size are unchanged, so rediscovering untouched manifests costs one
+        ``stat`` call each. The returned data is shared and must not be mutated.
+        """
 
         suffix = manifest_path.suffix.lower()
-        with manifest_path.open("r", encoding="utf-8") as handle:
-            if suffix == ".json":
-                return json.load(handle)
-            if suffix in {".yaml", ".yml"}:
-                if self._yaml is None:
-                    raise RuntimeError(
-                        "YAML manifest encountered but PyYAML is not installed."
-                    )
-                data = self._yaml.safe_load(handle)
-                return data if data is not None else {}
-        raise ValueError(f"Unsupported manifest type: {manifest_path}")
+        if suffix not in self.SUPPORTED_EXTENSIONS:
+            raise ValueError(f"Unsupported manifest type: {manifest_path}")
+        is_yaml = suffix in self._YAML_SUFFIXES
+        if is_yaml and self._yaml is None:
+            raise RuntimeError("YAML manifest encountered but PyYAML is not installed.")
+
+        st = manifest_path.stat()
+        data = self._manifest_cache.get(manifest_path, st)
+        if data is _UNSET:
+            if is_yaml:
+                data = self._load_yaml(manifest_path, st)
+            else:
+                data = _json_loads(manifest_path.read_bytes())
+            self._manifest_cache.put(manifest_path, st, data)
+        return data
+
+    def _load_yaml(self, manifest_path: Path, st: os.stat_result) -> object:
+        """Parse a YAML manifest, reusing its JSON sidecar when still valid."""
+
+        source = manifest_path.read_bytes()
+        # Timestamps alone are unreliable (``cp -p``, ``tar`` and coarse
+        # filesystems preserve or collide them), so the sidecar is keyed on
+        # the exact mtime, size and a digest of the YAML source.
+        stamp = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": hashlib.sha256(source).hexdigest(),
+        }
+        cache_path = manifest_path.with_name(manifest_path.name + self.YAML_CACHE_SUFFIX)
+        try:
+            cached = _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            cached = None
+        if isinstance(cached, dict) and cached.get("source") == stamp and "data" in cached:
+            return cached["data"]
+
+        # PyYAML detects the encoding of byte input itself.
+        data = self._yaml.safe_load(source)
+        data = data if data is not None else {}
+        self._write_yaml_cache(cache_path, stamp, data)
+        return data
+
+    @staticmethod
+    def _write_yaml_cache(cache_path: Path, stamp: Dict[str, object], data: object) -> None:
+        """Best-effort atomic write of *data* as the JSON sidecar at *cache_path*."""
+
+        try:
+            encoded = json.dumps({"source": stamp, "data": data}).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        # Skip values JSON cannot represent faithfully (dates, non-string keys).
+        if _json_loads(encoded)["data"] != data:
+            return
+
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=f"{cache_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                tmp_path = Path(handle.name)
+                handle.write(encoded)
+        except OSError:
+            return
+        try:
+            tmp_path.replace(cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
 
     def parse_metadata(self, manifest_path: Path) -> AppMetadata:
-        """Parse :class:`AppMetadata` from a manifest file."""
+        """Parse :class:`AppMetadata` from a manifest file.
 
-        raw = self.load_manifest(manifest_path)
-        return self.parse_metadata_dict(raw)
+        Results are cached per path and reused while the file's modification
+        time and size are unchanged; at most :attr:`METADATA_CACHE_SIZE` paths
+        are kept, evicting the least recently used. Cached metadata is shared between callers,
+        so its ``extra`` mapping must be treated as read-only.
+        """
+
+        st = manifest_path.stat()
+        cached = self._meta_cache.get(manifest_path, st)
+        if cached is not _UNSET:
+            return cached
+
+        metadata = self.parse_metadata_dict(self.load_manifest(manifest_path))
+        self._meta_cache.put(manifest_path, st, metadata)
+        return metadata
+
+    def clear_cache(self) -> None:
+        """Drop all cached manifest data and :class:`AppMetadata` entries."""
+
+        self._manifest_cache.clear()
+        self._meta_cache.clear()
 
     def parse_metadata_dict(self, raw: Dict[str, object]) -> AppMetadata:
         """Parse :class:`AppMetadata` from an already loaded manifest mapping."""
@@ -74,14 +323,6 @@ class ManifestParser:
         if not isinstance(raw, dict):
             raise ValueError("Manifest must define a mapping at the top level.")
 
-        def _require_string(value: object, field: str) -> str:
-            if not isinstance(value, str):
-                raise ValueError(f"Manifest field {field!r} must be a string.")
-            trimmed = value.strip()
-            if not trimmed:
-                raise ValueError(f"Manifest field {field!r} cannot be empty.")
-            return trimmed
-
         module_value = raw.get("module")
         class_value = raw.get("class", raw.get("class_name"))
         entry_point_value = raw.get("entry_point")
@@ -94,13 +335,10 @@ class ManifestParser:
                     "Manifest requires 'entry_point' to be a non-empty string if provided."
                 ) from exc
 
-            if ":" not in entry_point:
-                raise ValueError(
-                    "Manifest entry_point must be in 'module:Class' format."
-                )
-
-            module_part, class_part = (part.strip() for part in entry_point.split(":", 1))
-            if not module_part or not class_part:
+            module_part, sep, class_part = entry_point.partition(":")
+            module_part = module_part.strip()
+            class_part = class_part.strip()
+            if not sep or not module_part or not class_part:
                 raise ValueError(
                     "Manifest entry_point must be in 'module:Class' format."
                 )
@@ -126,27 +364,16 @@ class ManifestParser:
             ) from exc
 
         description = raw.get("description")
+        if isinstance(description, str):
+            description = sys.intern(description)
         icon = raw.get("icon")
-        extra_keys = {
-            "name",
-            "module",
-            "class",
-            "class_name",
-            "description",
-            "icon",
-            "entry_point",
-        }
-        extra = {key: value for key, value in raw.items() if key not in extra_keys}
-
-        metadata = AppMetadata(
-            name=name,
-            module=module,
-            class_name=class_name,
-            description=description,
-            icon=icon,
-            extra=extra,
-        )
-        return metadata
+        if isinstance(icon, str):
+            icon = sys.intern(icon)
+        extra = dict(raw)
+        for key in _RESERVED_MANIFEST_KEYS:
+            extra.pop(key, None)
+
+        return AppMetadata(name, module, class_name, description, icon, extra)
 
 
 class AppLoader:
@@ -161,18 +388,23 @@ class AppLoader:
         """Discover and parse metadata from the provided manifest locations."""
 
         flattened: List[str | Path] = []
+        flat_append = flattened.append
+        flat_extend = flattened.extend
         for location in locations:
             if isinstance(location, (str, Path)):
-                flattened.append(location)
+                flat_append(location)
             else:
-                flattened.extend(list(location))
+                flat_extend(location)
 
-        manifests = list(self.parser.discover(*flattened))
+        parser = self.parser
+        load_manifest = parser.load_manifest
+        parse_metadata = parser.parse_metadata
+        parse_aggregate_entry = self._parse_aggregate_entry
         metadata_items: List[Tuple[AppMetadata, Path]] = []
+        append = metadata_items.append
 
-        for manifest in manifests:
-            raw = self.parser.load_manifest(manifest)
-
+        for manifest in parser.discover(*flattened):
+            raw = load_manifest(manifest)
             if isinstance(raw, dict) and "apps" in raw:
                 apps_value = raw["apps"]
                 if not isinstance(apps_value, list):
@@ -183,75 +415,78 @@ class AppLoader:
                         raise ValueError(
                             f"Manifest entry at index {index} within 'apps' must be a mapping."
                         )
-
-                    combined_entry = dict(entry)
-                    manifest_ref = entry.get("manifest")
-                    if manifest_ref is not None:
-                        if not isinstance(manifest_ref, str):
-                            raise ValueError(
-                                "Manifest field 'manifest' must be a string path when provided."
-                            )
-
-                        nested_raw = None
-                        last_error: Exception | None = None
-                        candidate_paths = []
-                        manifest_ref_path = Path(manifest_ref)
-                        if not manifest_ref_path.is_absolute():
-                            candidate_paths.append(
-                                (manifest.parent / manifest_ref_path).resolve(strict=False)
-                            )
-                        candidate_paths.append(
-                            manifest_ref_path.expanduser().resolve(strict=False)
-                        )
-
-                        for candidate in candidate_paths:
-                            try:
-                                nested_raw = self.parser.load_manifest(candidate)
-                                break
-                            except FileNotFoundError as exc:
-                                last_error = exc
-
-                        if nested_raw is None:
-                            if last_error is not None:
-                                raise last_error
-                            raise FileNotFoundError(
-                                f"Unable to resolve nested manifest reference {manifest_ref!r}."
-                            )
-
-                        if not isinstance(nested_raw, dict):
-                            raise ValueError(
-                                "Nested manifest must define a mapping at the top level."
-                            )
-
-                        combined_entry = {**nested_raw, **combined_entry}
-
-                    metadata = self.parser.parse_metadata_dict(combined_entry)
-                    metadata_items.append((metadata, manifest))
+                    append((parse_aggregate_entry(manifest, entry), manifest))
                 continue
 
-            metadata = self.parser.parse_metadata_dict(raw)
-            metadata_items.append((metadata, manifest))
+            # Single-app manifests go through the stat-keyed metadata cache.
+            append((parse_metadata(manifest), manifest))
 
         return metadata_items
 
+    def _parse_aggregate_entry(self, manifest: Path, entry: Dict[str, object]) -> AppMetadata:
+        """Parse an ``apps`` entry of *manifest*, merging any nested manifest."""
+
+        combined_entry = dict(entry)
+        manifest_ref = entry.get("manifest")
+        if manifest_ref is not None:
+            if not isinstance(manifest_ref, str):
+                raise ValueError(
+                    "Manifest field 'manifest' must be a string path when provided."
+                )
+
+            nested_raw = None
+            last_error: Exception | None = None
+            candidate_paths = []
+            manifest_ref_path = Path(manifest_ref)
+            if not manifest_ref_path.is_absolute():
+                candidate_paths.append(
+                    (manifest.parent / manifest_ref_path).resolve(strict=False)
+                )
+            candidate_paths.append(manifest_ref_path.expanduser().resolve(strict=False))
+
+            for candidate in candidate_paths:
+                try:
+                    nested_raw = self.parser.load_manifest(candidate)
+                    break
+                except FileNotFoundError as exc:
+                    last_error = exc
+
+            if nested_raw is None:
+                if last_error is not None:
+                    raise last_error
+                raise FileNotFoundError(
+                    f"Unable to resolve nested manifest reference {manifest_ref!r}."
+                )
+
+            if not isinstance(nested_raw, dict):
+                raise ValueError("Nested manifest must define a mapping at the top level.")
+
+            combined_entry = {**nested_raw, **combined_entry}
+
+        return self.parser.parse_metadata_dict(combined_entry)
+
     def instantiate(self, metadata: AppMetadata) -> App:
         """Instantiate the application described by *metadata*."""
 
-        module = importlib.import_module(metadata.module)
-        try:
-            app_cls = getattr(module, metadata.class_name)
-        except AttributeError as exc:  # pragma: no cover - defensive path
-            raise AttributeError(
-                f"Module {metadata.module!r} does not define {metadata.class_name!r}"
-            ) from exc
-        if not issubclass(app_cls, App):
-            raise TypeError(
-                f"Manifest class {metadata.class_name} in {metadata.module}"
-                " is not a subclass of table_os.App"
-            )
+        key = (metadata.module, metadata.class_name)
+        app_cls = _CLASS_CACHE.get(key)
+        if app_cls is None:
+            app_cls = _cached_import(metadata.module, metadata.class_name)
+            if not issubclass(app_cls, App):
+                raise TypeError(
+                    f"Manifest class {metadata.class_name} in {metadata.module}"
+                    " is not a subclass of table_os.App"
+                )
+            _CLASS_CACHE[key] = app_cls
 
         init_kwargs = {}
         if isinstance(metadata.extra.get("init_kwargs"), dict):
             init_kwargs = dict(metadata.extra["init_kwargs"])
         app = app_cls(metadata=metadata, **init_kwargs)
         return app
+
+    @staticmethod
+    def clear_class_cache() -> None:
+        """Forget application classes resolved by :meth:`instantiate`."""
+
+        _CLASS_CACHE.clear()
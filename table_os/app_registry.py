@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from .app_base import App, AppMetadata
 from .app_loader import AppLoader, ManifestParser
@@ -28,6 +29,7 @@ class AppRegistry:
         self.loader = loader or AppLoader()
         self._registered: Dict[str, RegisteredApp] = {}
         self._running: Dict[str, App] = {}
+        self._sorted_cache: Optional[List[AppMetadata]] = None
 
     @property
     def parser(self) -> ManifestParser:
@@ -43,12 +45,18 @@ class AppRegistry:
         for metadata, manifest in discovered:
             self._registered[metadata.name] = RegisteredApp(metadata, manifest)
             metadata_items.append(metadata)
+        self._sorted_cache = None
         return metadata_items
 
     def list_apps(self) -> List[AppMetadata]:
         """Return metadata for registered applications sorted by name."""
 
-        return sorted((entry.metadata for entry in self._registered.values()), key=lambda m: m.name)
+        if self._sorted_cache is None:
+            self._sorted_cache = sorted(
+                (entry.metadata for entry in self._registered.values()),
+                key=attrgetter("name"),
+            )
+        return list(self._sorted_cache)
 
     def get_metadata(self, name: str) -> AppMetadata:
         """Return metadata for the application named *name*."""
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Callable, Dict, List
+from functools import partial
+from typing import Callable, Dict, Tuple
 
 
 class NavigationAction(str, Enum):
@@ -20,26 +21,35 @@ class HardwareInterface:
 
     def __init__(self) -> None:
         self._button_bindings: Dict[str, NavigationAction] = {}
-        self._action_listeners: List[Callable[[NavigationAction], None]] = []
+        # Copy-on-write: registering replaces the tuple, so dispatch can iterate
+        # it directly even if a listener registers another one mid-event.
+        self._action_listeners: Tuple[Callable[[NavigationAction], None], ...] = ()
+        # Per-button listener calls with the bound action pre-applied.
+        self._button_dispatch: Dict[str, Tuple[Callable[[], None], ...]] = {}
 
     def bind_button(self, button_id: str, action: NavigationAction) -> None:
         """Associate a hardware *button_id* with a navigation *action*."""
 
         self._button_bindings[button_id] = action
+        self._button_dispatch[button_id] = self._compose(action)
 
     def register_listener(self, listener: Callable[[NavigationAction], None]) -> None:
         """Register a callback invoked when a navigation *action* occurs."""
 
-        self._action_listeners.append(listener)
+        self._action_listeners = self._action_listeners + (listener,)
+        self._button_dispatch = {
+            button_id: self._compose(action)
+            for button_id, action in self._button_bindings.items()
+        }
 
     def emit_button_event(self, button_id: str) -> None:
         """Convert a raw button event into a navigation action and dispatch it."""
 
-        action = self._button_bindings.get(button_id)
-        if action is None:
-            return
-        for listener in list(self._action_listeners):
-            listener(action)
+        for dispatch in self._button_dispatch.get(button_id, ()):
+            dispatch()
+
+    def _compose(self, action: NavigationAction) -> Tuple[Callable[[], None], ...]:
+        return tuple(partial(listener, action) for listener in self._action_listeners)
 
     def default_bindings(self) -> None:
         """Configure default button bindings for a standard controller."""
@@ -1,6 +1,8 @@
 import json
+import os
 from pathlib import Path
 import sys
+import types
 
 import pytest
 
@@ -8,6 +10,7 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from table_os.app_base import App, AppMetadata
 from table_os.app_loader import AppLoader, ManifestParser
 
 
@@ -119,3 +122,342 @@ def test_load_metadata_supports_aggregate_manifest(tmp_path: Path) -> None:
     assert metadata.extra["capabilities"] == ["timekeeping"]
     assert metadata.extra["extra_field"] == "value"
     assert metadata.extra["manifest"] == "virtual_clock.json"
+
+
+def test_parse_metadata_reads_yaml_manifest(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    manifest = tmp_path / "app.yaml"
+    manifest.write_bytes(
+        "name: Example\nmodule: apps.example\nclass: ExampleApp\ndescription: Café\n".encode(
+            "utf-8"
+        )
+    )
+
+    metadata = ManifestParser().parse_metadata(manifest)
+
+    assert metadata.name == "Example"
+    assert metadata.description == "Café"
+
+
+def test_load_manifest_reuses_yaml_json_sidecar(tmp_path: Path) -> None:
+    pytest.importorskip("yaml")
+    manifest = tmp_path / "app.yaml"
+    manifest.write_text("name: Example\nmodule: apps.example\nclass: ExampleApp\n")
+
+    assert ManifestParser().load_manifest(manifest)["name"] == "Example"
+    sidecar = tmp_path / "app.yaml.cache.json"
+    assert json.loads(sidecar.read_text())["data"]["name"] == "Example"
+    assert list(ManifestParser().discover(tmp_path)) == [manifest.resolve()]
+
+    class _NoYaml:
+        @staticmethod
+        def safe_load(_data):
+            raise AssertionError("sidecar should have been used")
+
+    parser = ManifestParser()
+    parser._yaml = _NoYaml()
+    assert parser.load_manifest(manifest)["name"] == "Example"
+
+
+def test_load_manifest_ignores_sidecar_when_yaml_changes_with_same_mtime(
+    tmp_path: Path,
+) -> None:
+    pytest.importorskip("yaml")
+    manifest = tmp_path / "a.yaml"
+    manifest.write_text("name: A\n")
+    assert ManifestParser().load_manifest(manifest)["name"] == "A"
+
+    # Simulate ``cp -p``/``rsync -t``: new content, original timestamp.
+    st = manifest.stat()
+    manifest.write_text("name: B\n")
+    os.utime(manifest, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert ManifestParser().load_manifest(manifest)["name"] == "B"
+
+
+def test_discover_walks_nested_directories(tmp_path: Path) -> None:
+    nested = tmp_path / "group" / "inner"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.json").write_text("{}")
+    (nested / "deep.YML").write_text("")
+    (nested / "notes.txt").write_text("")
+    (tmp_path / "group" / "README").write_text("")
+
+    found = set(ManifestParser().discover(tmp_path))
+
+    assert found == {(tmp_path / "top.json").resolve(), (nested / "deep.YML").resolve()}
+
+
+def test_discover_skips_overlapping_locations(tmp_path: Path) -> None:
+    nested = tmp_path / "group"
+    nested.mkdir()
+    (tmp_path / "top.json").write_text("{}")
+    (nested / "inner.json").write_text("{}")
+
+    found = list(
+        ManifestParser().discover(nested, tmp_path, str(tmp_path), nested / "inner.json")
+    )
+
+    assert sorted(found) == sorted(
+        [(tmp_path / "top.json").resolve(), (nested / "inner.json").resolve()]
+    )
+
+
+def test_parse_metadata_cache_tracks_file_changes(tmp_path: Path) -> None:
+    parser = ManifestParser()
+    manifest = write_manifest(
+        tmp_path,
+        {"name": "Example", "module": "apps.example", "class": "ExampleApp"},
+    )
+
+    first = parser.parse_metadata(manifest)
+    assert parser.parse_metadata(manifest) is first
+
+    write_manifest(
+        tmp_path,
+        {"name": "Renamed", "module": "apps.example", "class": "ExampleApp"},
+    )
+    assert parser.parse_metadata(manifest).name == "Renamed"
+
+
+def test_load_metadata_rediscovery_reuses_cached_manifests(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import table_os.app_loader as app_loader
+
+    write_manifest(
+        tmp_path,
+        {"name": "Example", "module": "apps.example", "class": "ExampleApp"},
+    )
+    loader = AppLoader()
+    (first, _), = loader.load_metadata(str(tmp_path))
+
+    def fail(_data: bytes) -> None:
+        raise AssertionError("unchanged manifest was parsed again")
+
+    monkeypatch.setattr(app_loader, "_json_loads", fail)
+    (again, _), = loader.load_metadata(str(tmp_path))
+
+    assert again is first
+
+
+def test_parse_metadata_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    class SmallCacheParser(ManifestParser):
+        METADATA_CACHE_SIZE = 2
+
+    parser = SmallCacheParser()
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"app{index}.json"
+        path.write_text(
+            json.dumps({"name": f"App{index}", "module": "apps.example", "class": "ExampleApp"})
+        )
+        paths.append(path)
+
+    first = parser.parse_metadata(paths[0])
+    second = parser.parse_metadata(paths[1])
+    assert parser.parse_metadata(paths[0]) is first  # refreshes paths[0]
+    parser.parse_metadata(paths[2])  # evicts paths[1], the least recently used
+
+    assert parser.parse_metadata(paths[0]) is first
+    assert parser.parse_metadata(paths[1]) is not second
+
+    parser.clear_cache()
+    assert parser.parse_metadata(paths[0]) is not first
+
+
+def test_registry_discover_returns_metadata_and_validates_eagerly(tmp_path: Path) -> None:
+    from table_os.app_registry import AppRegistry
+
+    good = tmp_path / "good.json"
+    good.write_text(
+        json.dumps({"name": "Good", "module": "apps.example", "class": "ExampleApp"})
+    )
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"name": "Bad", "module": None}))
+
+    registry = AppRegistry()
+    discovered = registry.discover(str(good))
+    assert [metadata.name for metadata in discovered] == ["Good"]
+    assert registry.list_apps() == discovered
+
+    with pytest.raises(ValueError):
+        registry.discover(str(bad))
+    assert [metadata.name for metadata in registry.list_apps()] == ["Good"]
+
+
+def test_load_metadata_preserves_manifest_order(tmp_path: Path) -> None:
+    loader = AppLoader()
+    paths = []
+    for index in range(10):
+        path = tmp_path / f"app{index:02d}.json"
+        path.write_text(
+            json.dumps({"name": f"App{index}", "module": "apps.example", "class": "ExampleApp"})
+        )
+        paths.append(path)
+
+    results = loader.load_metadata([str(path) for path in paths])
+
+    assert [metadata.name for metadata, _ in results] == [
+        f"App{index}" for index in range(len(paths))
+    ]
+    assert [manifest for _, manifest in results] == [path.resolve() for path in paths]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_manifest_accepts_stdlib_json_extensions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+) -> None:
+    from app_library import json_compat
+
+    if not use_orjson:
+        monkeypatch.setattr(json_compat, "orjson", None)
+    elif json_compat.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    manifest = tmp_path / "app.json"
+    manifest.write_text(
+        '{"name": "Example", "module": "apps.example", "class": "ExampleApp", "scale": NaN}'
+    )
+
+    metadata = ManifestParser().parse_metadata(manifest)
+
+    assert metadata.extra["scale"] != metadata.extra["scale"]  # NaN
+
+
+def test_load_manifest_reports_invalid_json(tmp_path: Path) -> None:
+    manifest = tmp_path / "app.json"
+    manifest.write_text("{not json")
+
+    with pytest.raises(json.JSONDecodeError):
+        ManifestParser().load_manifest(manifest)
+
+
+def test_supported_extensions_override_controls_discovery_and_loading(tmp_path: Path) -> None:
+    class JsonOnlyParser(ManifestParser):
+        SUPPORTED_EXTENSIONS = {".json"}
+
+    (tmp_path / "app.json").write_text("{}")
+    (tmp_path / "app.yaml").write_text("name: Example\n")
+    parser = JsonOnlyParser()
+
+    assert list(parser.discover(tmp_path)) == [(tmp_path / "app.json").resolve()]
+    with pytest.raises(ValueError):
+        parser.load_manifest(tmp_path / "app.yaml")
+
+
+def test_discover_walks_filesystem_root(monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = ManifestParser()
+    walked = []
+
+    def fake_walk(directory, suffixes, visited):
+        walked.append(directory)
+        return iter(())
+
+    monkeypatch.setattr(parser, "_walk", fake_walk)
+    root = Path(Path.cwd().anchor)
+
+    list(parser.discover(root, Path.cwd()))
+
+    assert walked[0] == str(root.resolve())
+
+
+def test_discover_skips_nested_locations_already_walked(tmp_path: Path) -> None:
+    nested = tmp_path / "nested"
+    nested.mkdir()
+    (nested / "app.json").write_text("{}")
+
+    discovered = list(ManifestParser().discover(tmp_path, nested, nested / "app.json"))
+
+    assert discovered == [(nested / "app.json").resolve()]
+
+
+def test_discover_keeps_locations_below_unreadable_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    locked = tmp_path / "locked"
+    inner = locked / "inner"
+    inner.mkdir(parents=True)
+    manifest = inner / "app.json"
+    manifest.write_text("{}")
+    real_scandir = os.scandir
+
+    def fake_scandir(path):
+        if os.fspath(path) == os.fspath(locked.resolve()):
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", fake_scandir)
+
+    assert list(ManifestParser().discover(tmp_path, manifest)) == [manifest.resolve()]
+    assert list(ManifestParser().discover(tmp_path, inner)) == [manifest.resolve()]
+
+
+class _CachedApp(App):
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_app_module(monkeypatch: pytest.MonkeyPatch) -> types.ModuleType:
+    module = types.ModuleType("fake_cached_app")
+    module.CachedApp = _CachedApp
+    module.NotAnApp = object
+    monkeypatch.setitem(sys.modules, module.__name__, module)
+    AppLoader.clear_class_cache()
+    yield module
+    AppLoader.clear_class_cache()
+
+
+def test_instantiate_resolves_each_class_once(fake_app_module: types.ModuleType) -> None:
+    loader = AppLoader()
+    metadata = AppMetadata("Cached", fake_app_module.__name__, "CachedApp")
+
+    first = loader.instantiate(metadata)
+    del fake_app_module.CachedApp
+    second = loader.instantiate(metadata)
+
+    assert type(first) is type(second) is _CachedApp
+    assert second.metadata is metadata
+
+    AppLoader.clear_class_cache()
+    with pytest.raises(AttributeError):
+        loader.instantiate(metadata)
+
+
+def test_instantiate_rejects_non_app_classes(fake_app_module: types.ModuleType) -> None:
+    metadata = AppMetadata("Broken", fake_app_module.__name__, "NotAnApp")
+
+    with pytest.raises(TypeError):
+        AppLoader().instantiate(metadata)
+
+
+def test_instantiate_imports_modules_not_yet_loaded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    module_name = "fake_unloaded_app"
+    (tmp_path / f"{module_name}.py").write_text(
+        "from table_os.app_base import App\n"
+        "\n"
+        "class UnloadedApp(App):\n"
+        "    def start(self):\n"
+        "        pass\n"
+        "\n"
+        "    def stop(self):\n"
+        "        pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    AppLoader.clear_class_cache()
+
+    try:
+        app = AppLoader().instantiate(AppMetadata("Unloaded", module_name, "UnloadedApp"))
+    finally:
+        sys.modules.pop(module_name, None)
+        AppLoader.clear_class_cache()
+
+    assert type(app).__name__ == "UnloadedApp"
+    assert type(app).__module__ == module_name
@@ -0,0 +1,37 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from table_os.hardware_interface import HardwareInterface, NavigationAction
+
+
+def test_emit_button_event_dispatches_bound_action_to_listeners() -> None:
+    hardware = HardwareInterface()
+    received = []
+    hardware.register_listener(received.append)
+    hardware.default_bindings()
+    hardware.register_listener(lambda action: received.append(("second", action)))
+
+    hardware.emit_button_event("enter")
+    hardware.emit_button_event("unknown")
+
+    assert received == [NavigationAction.SELECT, ("second", NavigationAction.SELECT)]
+
+
+def test_listener_registered_during_dispatch_sees_next_event_only() -> None:
+    hardware = HardwareInterface()
+    hardware.bind_button("up", NavigationAction.MOVE_UP)
+    late = []
+
+    def register_late(_action: NavigationAction) -> None:
+        hardware.register_listener(late.append)
+
+    hardware.register_listener(register_late)
+    hardware.emit_button_event("up")
+    assert late == []
+
+    hardware.emit_button_event("up")
+    assert late == [NavigationAction.MOVE_UP]
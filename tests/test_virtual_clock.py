@@ -4,13 +4,22 @@ import json
 import sys
 import time
 import threading
+import types
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app_library.loader import get_app_entry, launch_app, list_apps
+from app_library.loader import (
+    get_app_entry,
+    launch_app,
+    list_apps,
+    load_app_class,
+    load_global_manifest,
+)
 from apps.virtual_clock.app import VirtualClockApp
 
 
@@ -46,17 +55,78 @@ def test_get_app_entry_accepts_manifest_path_string() -> None:
     assert entry["entry_point"] == "apps.virtual_clock.app:VirtualClockApp"
 
 
+def test_load_app_class_rejects_entry_point_without_separator() -> None:
+    with pytest.raises(ValueError, match="expected 'module:Class'"):
+        load_app_class("apps.virtual_clock.app.VirtualClockApp")
+
+
+def test_load_app_class_imports_partially_initialized_modules(monkeypatch) -> None:
+    from importlib.machinery import ModuleSpec
+
+    import app_library.loader as loader_module
+
+    partial = types.ModuleType("fake_partial_app")
+    partial.__spec__ = ModuleSpec(partial.__name__, None)
+    partial.__spec__._initializing = True
+    complete = types.ModuleType(partial.__name__)
+    complete.PartialApp = VirtualClockApp
+    imported = []
+
+    def fake_import_module(name):
+        imported.append(name)
+        return complete
+
+    monkeypatch.setitem(sys.modules, partial.__name__, partial)
+    monkeypatch.setattr(loader_module, "import_module", fake_import_module)
+    load_app_class.cache_clear()
+    try:
+        assert load_app_class("fake_partial_app:PartialApp") is VirtualClockApp
+    finally:
+        load_app_class.cache_clear()
+    assert imported == ["fake_partial_app"]
+
+
+def test_load_global_manifest_accepts_path_and_string() -> None:
+    from_path = load_global_manifest(Path("apps/manifest.json"))
+    from_string = load_global_manifest("apps/manifest.json")
+    assert from_path == from_string
+    assert any(app["id"] == "virtual_clock" for app in from_string["apps"])
+
+
+def test_get_app_entry_prefers_first_duplicate_and_reports_missing_id() -> None:
+    manifest = {"apps": [{"id": "clock", "n": 1}, {"id": "clock", "n": 2}]}
+    assert get_app_entry("clock", manifest)["n"] == 1
+    with pytest.raises(KeyError, match="No app with id 'missing'"):
+        get_app_entry("missing", manifest)
+
+
+def test_load_global_manifest_reuses_cache_until_file_changes(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps({"apps": [{"id": "first"}]}), encoding="utf-8")
+
+    first = load_global_manifest(manifest_path)
+    assert load_global_manifest(manifest_path) is first
+
+    manifest_path.write_text(
+        json.dumps({"apps": [{"id": "first"}, {"id": "second"}]}), encoding="utf-8"
+    )
+    reloaded = load_global_manifest(manifest_path)
+    assert [app["id"] for app in reloaded["apps"]] == ["first", "second"]
+
+
 class _FakeRoot:
     def __init__(self) -> None:
         self._callbacks = []
         self._quit_event = threading.Event()
         self._destroyed = False
         self.protocols = {}
+        self.scheduled = []
 
     def title(self, _text: str) -> None:
         pass
 
-    def after(self, _delay: int, callback):
+    def after(self, delay: int, callback):
+        self.scheduled.append((delay, callback))
         self._callbacks.append(callback)
         return len(self._callbacks) - 1
 
@@ -84,6 +154,20 @@ class _FakeRoot:
         self._destroyed = True
 
 
+class _ScriptedRoot(_FakeRoot):
+    """Root whose main loop runs a fixed number of passes and then returns."""
+
+    passes = 4
+
+    def mainloop(self) -> None:
+        for _ in range(self.passes):
+            callbacks = list(self._callbacks)
+            self._callbacks = []
+            for callback in callbacks:
+                if callback is not None:
+                    callback()
+
+
 class _FakeLabel:
     def __init__(self, _root, *, text: str, font):
         self.text_values = [text]
@@ -97,16 +181,24 @@ class _FakeLabel:
 
 
 class _FakeTkModule:
-    def __init__(self) -> None:
+    def __init__(self, root_factory=_FakeRoot) -> None:
         self.created_roots = []
         self.Label = _FakeLabel
+        self._root_factory = root_factory
 
     def Tk(self):
-        root = _FakeRoot()
+        root = self._root_factory()
         self.created_roots.append(root)
         return root
 
 
+def test_virtual_clock_supports_weak_references() -> None:
+    import weakref
+
+    app = VirtualClockApp(tk_module=_FakeTkModule())
+    assert weakref.ref(app)() is app
+
+
 def test_virtual_clock_start_and_stop_with_fake_tk() -> None:
     fake_tk = _FakeTkModule()
     app = VirtualClockApp(tk_module=fake_tk)
@@ -118,3 +210,46 @@ def test_virtual_clock_start_and_stop_with_fake_tk() -> None:
     app.stop()
     assert not app.running
     assert fake_tk.created_roots[0]._destroyed is True
+
+
+def test_virtual_clock_stop_schedules_immediate_quit() -> None:
+    fake_tk = _FakeTkModule()
+    app = VirtualClockApp(tk_module=fake_tk)
+    app.start()
+
+    deadline = time.monotonic() + 1.0
+    while app._root is None and time.monotonic() < deadline:
+        time.sleep(0.005)
+    root = fake_tk.created_roots[0]
+
+    app.stop()
+
+    assert (0, root.quit) in root.scheduled
+    assert root._quit_event.is_set()
+
+
+def test_virtual_clock_tick_updates_label_only_when_second_changes(monkeypatch) -> None:
+    readings = iter(["10:00:00", "10:00:00", "10:00:01", "10:00:01", "10:00:02"])
+    monkeypatch.setattr(VirtualClockApp, "_formatted_time", staticmethod(lambda: next(readings)))
+    fake_tk = _FakeTkModule(root_factory=_ScriptedRoot)
+    app = VirtualClockApp(tk_module=fake_tk)
+    app._stop_event = threading.Event()
+
+    app._run_ui_loop()
+
+    root = fake_tk.created_roots[0]
+    assert app._label.text_values == ["10:00:00", "10:00:01", "10:00:02"]
+    assert len(root.scheduled) == _ScriptedRoot.passes + 1
+    assert all(0 < delay <= 1000 for delay, _ in root.scheduled)
+
+
+def test_virtual_clock_close_request_sets_stop_event_and_quits() -> None:
+    app = VirtualClockApp(tk_module=_FakeTkModule())
+    root = _FakeRoot()
+    app._stop_event = threading.Event()
+    app._root = root
+
+    app._handle_close_request()
+
+    assert app._stop_event.is_set()
+    assert root._quit_event.is_set()